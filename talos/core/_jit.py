@@ -0,0 +1,29 @@
+"""Optional Numba acceleration with a pure Python fallback."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+    prange = range
+
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable[..., Any]:
+    """Compile with ``numba.njit`` when installed, otherwise return the function unchanged."""
+
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
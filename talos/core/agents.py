@@ -3,24 +3,45 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Optional, Protocol, Sequence
+from typing import Any, ClassVar, Dict, Iterable, Optional, Protocol, Sequence, Tuple
 
+import numpy as np
 from tinygrad import Tensor
 
 
-TensorLike = float | Sequence[float] | Tensor
+TensorLike = float | Sequence[float] | np.ndarray | Tensor
 
 
 def _as_tensor(value: TensorLike, device: str) -> Tensor:
     if isinstance(value, Tensor):
         return value
+    if isinstance(value, np.ndarray):
+        return Tensor(value, device=device)
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
         return Tensor(list(value), device=device)
     return Tensor([float(value)], device=device)
 
 
+def _as_host(value: Optional[TensorLike]) -> Optional[np.ndarray]:
+    """Host float32 array for host-side inputs; ``None`` for tensors already on a device."""
+    if value is None or isinstance(value, Tensor):
+        return None
+    if isinstance(value, np.ndarray):
+        return value.astype(np.float32, copy=False)
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return np.asarray(list(value), dtype=np.float32)
+    return np.asarray([float(value)], dtype=np.float32)
+
+
 class PreferenceModel(Protocol):
-    """Callable contract used to score an agent's reservation price."""
+    """Callable contract used to score an agent's reservation price.
+
+    Models that never read ``market_state["step"]`` may set ``uses_step = False``;
+    callables that do not declare the attribute are assumed to need it.
+    """
+
+    # Annotation only: explicit subclasses must not inherit a default that drops ``step``.
+    uses_step: ClassVar[bool]
 
     def __call__(self, features: Optional[Tensor], market_state: Dict[str, Tensor]) -> Tensor:
         ...
@@ -30,6 +51,8 @@ class PreferenceModel(Protocol):
 class LinearPreferenceModel:
     """Simple linear preference model using tinygrad tensors."""
 
+    uses_step: ClassVar[bool] = False
+
     weights: Optional[Tensor] = None
     bias: Tensor = field(default_factory=lambda: Tensor([0.0]))
 
@@ -51,24 +74,49 @@ class EconomicAgent:
     model: Optional[PreferenceModel] = None
     device: str = "cpu"
 
+    _context_epoch: ClassVar[int] = 0
+
     def __post_init__(self) -> None:
-        self._quantity_tensor = _as_tensor(self.quantity, self.device)
-        self._features_tensor = _as_tensor(self.features, self.device) if self.features is not None else None
+        # Tensors are built on first use; markets on the host path never need them.
+        self._quantity_tensor: Optional[Tensor] = None
+        self._features_tensor = self.features if isinstance(self.features, Tensor) else None
+        self._features_host = _as_host(self.features)
+        # (matrix, row) when the features are one row of a matrix shared by a whole population.
+        self._shared_features: Optional[Tuple[Tensor, int]] = None
         if self.model is None:
             self.model = LinearPreferenceModel(bias=Tensor([1.0], device=self.device))
 
     def reservation_price(self, market_state: Dict[str, Tensor]) -> Tensor:
         if self.model is None:
             raise ValueError("Preference model is not defined for this agent.")
-        return self.model(self._features_tensor, market_state)
+        return self.model(self.tensor_features(), market_state)
+
+    def tensor_features(self) -> Optional[Tensor]:
+        if self._features_tensor is None:
+            if self._shared_features is not None:
+                matrix, row = self._shared_features
+                self._features_tensor = matrix[row]
+            elif self.features is not None:
+                self._features_tensor = _as_tensor(self.features, self.device)
+        return self._features_tensor
 
     def tensor_quantity(self) -> Tensor:
+        if self._quantity_tensor is None:
+            self._quantity_tensor = _as_tensor(self.quantity, self.device)
         return self._quantity_tensor
 
     def update_context(self, **kwargs: Any) -> None:
         features = kwargs.get("features")
         if features is not None:
             self._features_tensor = _as_tensor(features, self.device)
+            self._features_host = _as_host(features)
+            self._shared_features = None
+            EconomicAgent._context_epoch += 1
+
+    @staticmethod
+    def context_epoch() -> int:
+        """Counter bumped whenever any agent's context changes; used by market caches."""
+        return EconomicAgent._context_epoch
 
 
 @dataclass(slots=True)
@@ -77,7 +125,7 @@ class BuyerAgent(EconomicAgent):
 
     def demand_at_price(self, price: Tensor, market_state: Dict[str, Tensor]) -> Tensor:
         reservation = self.reservation_price(market_state)
-        return Tensor.where(price <= reservation, self.tensor_quantity(), Tensor([0.0], device=self.device))
+        return (price <= reservation).cast(price.dtype) * self.tensor_quantity()
 
     def willing_to_trade(self, price: Tensor, market_state: Dict[str, Tensor]) -> bool:
         demand = self.demand_at_price(price, market_state)
@@ -90,7 +138,7 @@ class SellerAgent(EconomicAgent):
 
     def supply_at_price(self, price: Tensor, market_state: Dict[str, Tensor]) -> Tensor:
         reservation = self.reservation_price(market_state)
-        return Tensor.where(price >= reservation, self.tensor_quantity(), Tensor([0.0], device=self.device))
+        return (price >= reservation).cast(price.dtype) * self.tensor_quantity()
 
     def willing_to_trade(self, price: Tensor, market_state: Dict[str, Tensor]) -> bool:
         supply = self.supply_at_price(price, market_state)
@@ -23,6 +23,8 @@ class CurveSamplingConfig:
 	verify: bool = True
 	verify_samples: int = 5
 	verify_tolerance: float = 1e-6
+	# Price resolution the curves may be sampled at; >= 1e-3 enables int16 fixed-point compares.
+	tolerance: float = 0.0
 
 
 @dataclass(slots=True)
@@ -36,6 +38,7 @@ class SimulationConfig:
 	adjustment_rate: float = 0.05
 	price_bounds: Tuple[float, float] = (0.05, 25.0)
 	log_trades: bool = False
+	exact_equilibrium: bool = False
 	random_seed: Optional[int] = None
 	device: DeviceConfig = field(default_factory=DeviceConfig)
 	curve_sampling: CurveSamplingConfig = field(default_factory=CurveSamplingConfig)
@@ -3,12 +3,107 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 from tinygrad import Tensor
 from tqdm.auto import tqdm
 
-from .agents import BuyerAgent, SellerAgent
+from .agents import BuyerAgent, EconomicAgent, LinearPreferenceModel, SellerAgent
+
+
+def _price_value(price: Tensor | float) -> float:
+	if isinstance(price, Tensor):
+		return float(price.item())
+	return float(price)
+
+
+PRICE_DTYPE = np.int16
+PRICE_SCALE = 1000
+_FIXED_POINT_MAX = np.iinfo(PRICE_DTYPE).max
+
+
+def _to_fixed_point(values: np.ndarray) -> np.ndarray:
+	"""Quantize prices to ``PRICE_DTYPE`` ticks of ``1 / PRICE_SCALE``.
+
+	Values are clipped to a symmetric range so negation never overflows;
+	compares are exact except when two prices lie within one tick.
+	"""
+
+	scaled = np.round(np.asarray(values, dtype=np.float64) * PRICE_SCALE)
+	return np.clip(scaled, -_FIXED_POINT_MAX, _FIXED_POINT_MAX).astype(PRICE_DTYPE)
+
+
+def _host_reservations(agents: Sequence[EconomicAgent]) -> np.ndarray:
+	"""Evaluate linear reservations in NumPy from host feature copies.
+
+	Shared models are copied to the host once, so populations built with a
+	common model cost two device reads regardless of size.
+	"""
+
+	params: Dict[int, Tuple[np.ndarray, np.float32]] = {}
+	for agent in agents:
+		model = agent.model
+		if id(model) not in params:
+			params[id(model)] = (
+				model.weights.numpy().reshape(-1).astype(np.float32),
+				np.float32(model.bias.numpy().reshape(-1)[0]),
+			)
+	features = np.stack([agent._features_host.reshape(-1) for agent in agents])
+	weights = np.stack([params[id(agent.model)][0] for agent in agents])
+	bias = np.array([params[id(agent.model)][1] for agent in agents], dtype=np.float32)
+	return ((features * weights).sum(axis=1) + bias).astype(np.float32)
+
+
+def _feature_width(agent: EconomicAgent) -> Optional[int]:
+	if agent._features_host is not None:
+		return agent._features_host.size
+	features = agent.tensor_features()
+	return None if features is None else features.numel()
+
+
+def _shared_feature_rows(agents: Sequence[EconomicAgent]) -> Optional[Tuple[Tensor, np.ndarray]]:
+	"""The one matrix all ``agents`` take their features from, with their rows; ``None`` otherwise.
+
+	Populations built together share a feature matrix and a model, so their
+	reservations come from a single product over the matrix.
+	"""
+
+	source = agents[0]._shared_features
+	if source is None:
+		return None
+	matrix, model = source[0], agents[0].model
+	rows = np.empty(len(agents), dtype=np.intp)
+	for idx, agent in enumerate(agents):
+		source = agent._shared_features
+		if source is None or source[0] is not matrix or agent.model is not model:
+			return None
+		rows[idx] = source[1]
+	return matrix, rows
+
+
+# Agent methods the cached paths reproduce; an override of any of them forces the tensor path.
+_AGENT_METHODS = ("reservation_price", "tensor_features", "tensor_quantity", "willing_to_trade")
+_BUYER_METHODS = (*_AGENT_METHODS, "demand_at_price")
+_SELLER_METHODS = (*_AGENT_METHODS, "supply_at_price")
+
+
+def _uses_stock_methods(agent_type: type) -> bool:
+	if issubclass(agent_type, BuyerAgent):
+		base, names = BuyerAgent, _BUYER_METHODS
+	elif issubclass(agent_type, SellerAgent):
+		base, names = SellerAgent, _SELLER_METHODS
+	else:
+		return False
+	return all(getattr(agent_type, name) is getattr(base, name) for name in names)
+
+
+def _sorted_if_uniform(reservations: Optional[np.ndarray], quantities: np.ndarray) -> Optional[np.ndarray]:
+	"""Sorted reservations when every agent trades the same quantity, else ``None``."""
+
+	if reservations is None or quantities.size == 0 or not np.all(quantities == quantities[0]):
+		return None
+	return np.sort(reservations)
 
 
 @dataclass(slots=True)
@@ -35,11 +130,11 @@ class MarketObservation:
 
 @dataclass(slots=True)
 class CurveData:
-	"""Demand and supply curve samples."""
+	"""Demand and supply curve samples as float64 arrays."""
 
-	prices: List[float]
-	demand: List[float]
-	supply: List[float]
+	prices: np.ndarray
+	demand: np.ndarray
+	supply: np.ndarray
 
 
 class Market:
@@ -54,32 +149,202 @@ class Market:
 		self.buyers: List[BuyerAgent] = list(buyers) if buyers is not None else []
 		self.sellers: List[SellerAgent] = list(sellers) if sellers is not None else []
 		self.device = device
+		self._cache_valid = False
+		# Device scratch buffers for the tensor path, allocated on first use.
+		self._price_scratch: Optional[Tensor] = None
+		self._curve_scratch: Optional[Tensor] = None
 
 	def register_buyer(self, agent: BuyerAgent) -> None:
 		self.buyers.append(agent)
+		self._cache_valid = False
 
 	def register_seller(self, agent: SellerAgent) -> None:
 		self.sellers.append(agent)
+		self._cache_valid = False
+
+	def _static_reservations(self, agents: Sequence[EconomicAgent]) -> Optional[np.ndarray]:
+		"""Evaluate reservation prices once for agents with state-free linear models.
+
+		Returns ``None`` when any agent uses a custom preference model, overrides
+		one of the agent methods the cache stands in for, or when feature widths
+		differ, in which case callers fall back to tinygrad.
+		"""
+
+		if not agents:
+			return np.zeros(0, dtype=np.float32)
+		if not all(_uses_stock_methods(agent_type) for agent_type in {type(agent) for agent in agents}):
+			return None
+		width: Optional[int] = None
+		# Weight widths per distinct model; populations usually share one.
+		model_widths: Dict[int, int] = {}
+		for agent in agents:
+			model = agent.model
+			if id(model) not in model_widths:
+				if not isinstance(model, LinearPreferenceModel) or model.weights is None:
+					return None
+				if model.bias.numel() != 1:
+					return None
+				model_widths[id(model)] = model.weights.numel()
+			agent_width = _feature_width(agent)
+			if agent_width is None or agent_width != model_widths[id(model)]:
+				return None
+			if width is None:
+				width = agent_width
+			elif agent_width != width:
+				return None
+
+		if self.device == "cpu" and all(agent._features_host is not None for agent in agents):
+			return _host_reservations(agents)
+
+		shared = _shared_feature_rows(agents)
+		if shared is not None:
+			matrix, rows = shared
+			model = agents[0].model
+			reservations = (matrix * model.weights.reshape(1, -1)).sum(axis=-1) + model.bias.reshape(-1)
+			return reservations.numpy().astype(np.float32)[rows]
+
+		features_matrix = Tensor.stack(*[agent.tensor_features().reshape(-1) for agent in agents])
+		weights_matrix = Tensor.stack(*[agent.model.weights.reshape(-1) for agent in agents])
+		bias_vector = Tensor.cat(*[agent.model.bias.reshape(-1) for agent in agents])
+		reservations = (features_matrix * weights_matrix).sum(axis=-1) + bias_vector
+		return reservations.numpy().astype(np.float32)
+
+	def _rebuild_cache(self) -> None:
+		self._buyer_R = self._static_reservations(self.buyers)
+		self._seller_R = self._static_reservations(self.sellers)
+		self._buyer_ids = [buyer.agent_id for buyer in self.buyers]
+		self._seller_ids = [seller.agent_id for seller in self.sellers]
+		self._buyer_q_np = np.array([buyer.quantity for buyer in self.buyers], dtype=np.float64)
+		self._seller_q_np = np.array([seller.quantity for seller in self.sellers], dtype=np.float64)
+		self._buyer_R_sorted = _sorted_if_uniform(self._buyer_R, self._buyer_q_np)
+		self._seller_R_sorted = _sorted_if_uniform(self._seller_R, self._seller_q_np)
+		self._uses_step = any(
+			getattr(agent.model, "uses_step", True) for agent in (*self.buyers, *self.sellers)
+		)
+		self._verified_key: Optional[tuple] = None
+		self._fused: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, int]] = None
+		self._fused_fixed: Optional[Tuple[np.ndarray, np.ndarray]] = None
+		self._cache_epoch = EconomicAgent.context_epoch()
+		self._cache_valid = True
+
+	def _ensure_cache(self) -> None:
+		if not self._cache_valid or self._cache_epoch != EconomicAgent.context_epoch():
+			self._rebuild_cache()
+
+	def invalidate_cache(self) -> None:
+		"""Drop cached reservations, e.g. after mutating agents in place."""
+
+		self._cache_valid = False
+
+	def _host_path_available(self) -> bool:
+		"""True when reservations are evaluated on the host and every aggregate stays in NumPy."""
+
+		if self.device != "cpu":
+			return False
+		for agent in (*self.buyers, *self.sellers):
+			if not isinstance(agent.model, LinearPreferenceModel) or agent._features_host is None:
+				return False
+		return self._fused_schedule() is not None
+
+	def _is_static(self) -> bool:
+		self._ensure_cache()
+		return self._buyer_R is not None and self._seller_R is not None
+
+	_AGGREGATE_METHODS = ("aggregate_demand", "aggregate_supply", "_vectorized_demand", "_vectorized_supply")
+
+	def _aggregates_from(self, owner: type) -> bool:
+		"""True when every aggregate method is the one ``owner`` defines, i.e. none is overridden."""
+
+		cls = type(self)
+		return all(getattr(cls, name) is getattr(owner, name) for name in self._AGGREGATE_METHODS)
+
+	def _reservation_schedules(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+		"""Return ``(buyer_R, buyer_q, seller_R, seller_q)`` when aggregates are threshold sums.
+
+		Demand at price ``p`` is ``buyer_q[p <= buyer_R].sum()`` and supply is
+		``seller_q[p >= seller_R].sum()``. Returns ``None`` when a subclass overrides
+		the aggregates, so the simulation falls back to calling them.
+		"""
+
+		if not self._aggregates_from(Market) or not self._is_static():
+			return None
+		return self._buyer_R, self._buyer_q_np, self._seller_R, self._seller_q_np
+
+	def _fused_schedule(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, int]]:
+		"""Stack both sides into ``(thresholds, signs, quantities, n_buyers)``.
+
+		Signs are ``+1`` for buyers and ``-1`` for sellers and thresholds are
+		``signs * R``, so a single compare ``signs * p <= thresholds`` tests
+		``p <= R`` for buyers and ``p >= R`` for sellers in one pass.
+		"""
+
+		self._ensure_cache()
+		if self._fused is None:
+			schedules = self._reservation_schedules()
+			if schedules is None:
+				return None
+			buyer_R, buyer_q, seller_R, seller_q = schedules
+			signs = np.concatenate(
+				(np.ones(len(buyer_R), dtype=np.float32), -np.ones(len(seller_R), dtype=np.float32))
+			)
+			thresholds = np.concatenate((buyer_R, -seller_R)).astype(np.float32)
+			quantities = np.concatenate((buyer_q, seller_q)).astype(np.float64)
+			self._fused = (thresholds, signs, quantities, len(buyer_R))
+		return self._fused
+
+	def _fused_hits(self, prices: np.ndarray) -> np.ndarray:
+		thresholds, signs, _, _ = self._fused_schedule()
+		return prices[:, None] * signs[None, :] <= thresholds[None, :]
+
+	def _fused_flows(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		_, _, quantities, n_buyers = self._fused_schedule()
+		hits = self._fused_hits(prices)
+		return hits[:, :n_buyers] @ quantities[:n_buyers], hits[:, n_buyers:] @ quantities[n_buyers:]
+
+	def _fixed_point_flows(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+		"""Fused demand/supply using int16 fixed-point thresholds and probe prices."""
+
+		thresholds, signs, quantities, n_buyers = self._fused_schedule()
+		if self._fused_fixed is None:
+			self._fused_fixed = (_to_fixed_point(thresholds), signs.astype(PRICE_DTYPE))
+		thresholds_q, signs_q = self._fused_fixed
+		hits = _to_fixed_point(prices)[:, None] * signs_q[None, :] <= thresholds_q[None, :]
+		return hits[:, :n_buyers] @ quantities[:n_buyers], hits[:, n_buyers:] @ quantities[n_buyers:]
+
+	def _price_tensor(self, price: Tensor | float) -> Tensor:
+		if isinstance(price, Tensor):
+			return price
+		if self._price_scratch is None:
+			self._price_scratch = Tensor.empty((1,), device=self.device)
+		return self._price_scratch.assign(Tensor([float(price)], device=self.device))
+
+	def _curve_tensor(self, prices: List[float]) -> Tensor:
+		if self._curve_scratch is None or self._curve_scratch.shape != (len(prices),):
+			self._curve_scratch = Tensor.empty((len(prices),), device=self.device)
+		return self._curve_scratch.assign(Tensor(prices, device=self.device))
 
 	def build_state(self, step: int, price: Tensor) -> Dict[str, Tensor]:
+		self._ensure_cache()
+		if not self._uses_step:
+			return {"price": price}
 		return {
 			"step": Tensor([float(step)], device=self.device),
 			"price": price,
 		}
 
-	def aggregate_demand(self, price: Tensor, market_state: Dict[str, Tensor]) -> float:
-		total = 0.0
-		for buyer in self.buyers:
-			demand_tensor = buyer.demand_at_price(price, market_state)
-			total += float(demand_tensor.item())
-		return total
+	def aggregate_demand(self, price: Tensor | float, market_state: Dict[str, Tensor]) -> float:
+		self._ensure_cache()
+		if self._buyer_R is not None:
+			price_val = np.float32(_price_value(price))
+			return float(((price_val <= self._buyer_R) * self._buyer_q_np).sum())
+		return float(self._tensor_demand(self._price_tensor(price), market_state).sum().item())
 
-	def aggregate_supply(self, price: Tensor, market_state: Dict[str, Tensor]) -> float:
-		total = 0.0
-		for seller in self.sellers:
-			supply_tensor = seller.supply_at_price(price, market_state)
-			total += float(supply_tensor.item())
-		return total
+	def aggregate_supply(self, price: Tensor | float, market_state: Dict[str, Tensor]) -> float:
+		self._ensure_cache()
+		if self._seller_R is not None:
+			price_val = np.float32(_price_value(price))
+			return float(((price_val >= self._seller_R) * self._seller_q_np).sum())
+		return float(self._tensor_supply(self._price_tensor(price), market_state).sum().item())
 
 	def sample_curves(
 		self,
@@ -90,20 +355,35 @@ class Market:
 		verify: bool = True,
 		verify_samples: int = 5,
 		verify_tolerance: float = 1e-6,
+		price_tolerance: float = 0.0,
 	) -> CurveData:
 		price_list = list(prices)
 		if not price_list:
-			return CurveData(prices=[], demand=[], supply=[])
-
-		price_tensor = Tensor(price_list, device=self.device)
-		price_tensor = price_tensor.reshape(-1)
-		state_vector = self.build_state(step=0, price=price_tensor)
-
-		demand_vector = self._vectorized_demand(price_tensor, state_vector)
-		supply_vector = self._vectorized_supply(price_tensor, state_vector)
-
-		demand = [float(x) for x in demand_vector.numpy().tolist()]
-		supply = [float(x) for x in supply_vector.numpy().tolist()]
+			empty = np.zeros(0, dtype=np.float64)
+			return CurveData(prices=empty, demand=empty.copy(), supply=empty.copy())
+
+		price_arr = np.asarray(price_list, dtype=np.float32)
+		state_vector: Dict[str, Tensor] = {}
+		if not self._is_static():
+			price_tensor = self._curve_tensor(price_list)
+			state_vector = self.build_state(step=0, price=price_tensor)
+
+		# Fixed-point compares only when the caller tolerates a 1 / PRICE_SCALE resolution.
+		fixed_point = price_tolerance >= 1.0 / PRICE_SCALE and bool(
+			np.all(np.abs(price_arr) < _FIXED_POINT_MAX / PRICE_SCALE)
+		)
+		if self._buyer_R_sorted is None and self._seller_R_sorted is None and self._fused_schedule() is not None:
+			if fixed_point:
+				demand_vector, supply_vector = self._fixed_point_flows(price_arr)
+			else:
+				demand_vector, supply_vector = self._fused_flows(price_arr)
+		else:
+			fixed_point = False
+			demand_vector = self._vectorized_demand(price_arr, state_vector)
+			supply_vector = self._vectorized_supply(price_arr, state_vector)
+
+		demand = np.asarray(demand_vector, dtype=np.float64)
+		supply = np.asarray(supply_vector, dtype=np.float64)
 
 		progress_bar = None
 		if show_progress:
@@ -116,26 +396,64 @@ class Market:
 			)
 			progress_bar.close()
 
-		if verify:
+		verify_key = (price_arr.tobytes(), verify_samples, verify_tolerance, fixed_point)
+		if verify and verify_key != self._verified_key:
 			check_count = min(verify_samples, len(price_list))
-			for idx in range(check_count):
-				price_value = price_list[idx]
-				scalar_price = Tensor([price_value], device=self.device)
-				state_scalar = self.build_state(step=idx, price=scalar_price)
-				demand_scalar = self.aggregate_demand(scalar_price, state_scalar)
-				supply_scalar = self.aggregate_supply(scalar_price, state_scalar)
-				demand_diff = abs(demand_scalar - demand[idx])
-				supply_diff = abs(supply_scalar - supply[idx])
+			schedules = self._reservation_schedules()
+			if schedules is not None:
+				# Dense recompute against the cached reservations, independent of any sorted fast path.
+				buyer_R, buyer_q, seller_R, seller_q = schedules
+				probe = price_arr[:check_count, None]
+				if fixed_point:
+					probe = _to_fixed_point(probe)
+					buyer_R, seller_R = _to_fixed_point(buyer_R), _to_fixed_point(seller_R)
+				demand_check = (probe <= buyer_R[None, :]) @ buyer_q
+				supply_check = (probe >= seller_R[None, :]) @ seller_q
+			else:
+				demand_check = np.empty(check_count)
+				supply_check = np.empty(check_count)
+				for idx in range(check_count):
+					scalar_price = self._price_tensor(price_list[idx])
+					state_scalar = self.build_state(step=idx, price=scalar_price)
+					demand_check[idx] = self.aggregate_demand(scalar_price, state_scalar)
+					supply_check[idx] = self.aggregate_supply(scalar_price, state_scalar)
+			demand_drift = np.abs(demand_check - demand_vector[:check_count])
+			supply_drift = np.abs(supply_check - supply_vector[:check_count])
+			if check_count:
+				idx = int(np.argmax(demand_drift))
 				assert (
-					demand_diff <= verify_tolerance
-				), f"Vectorized demand drift {demand_diff} exceeds tolerance at index {idx}."
+					demand_drift[idx] <= verify_tolerance
+				), f"Vectorized demand drift {demand_drift[idx]} exceeds tolerance at index {idx}."
+				idx = int(np.argmax(supply_drift))
 				assert (
-					supply_diff <= verify_tolerance
-				), f"Vectorized supply drift {supply_diff} exceeds tolerance at index {idx}."
-
-		return CurveData(prices=price_list, demand=demand, supply=supply)
-
-	def _vectorized_demand(self, price_tensor: Tensor, state_vector: Dict[str, Tensor]) -> Tensor:
+					supply_drift[idx] <= verify_tolerance
+				), f"Vectorized supply drift {supply_drift[idx]} exceeds tolerance at index {idx}."
+			# Repeated runs over the same grid and cache skip re-verification.
+			if schedules is not None:
+				self._verified_key = verify_key
+
+		return CurveData(prices=np.asarray(price_list, dtype=np.float64), demand=demand, supply=supply)
+
+	def _vectorized_demand(self, prices: np.ndarray, state_vector: Dict[str, Tensor]) -> np.ndarray:
+		self._ensure_cache()
+		if self._buyer_R_sorted is not None:
+			# count(R >= p) for every probe in O(K log N); quantities are uniform.
+			count = len(self._buyer_R_sorted) - np.searchsorted(self._buyer_R_sorted, prices, side="left")
+			return count * self._buyer_q_np[0]
+		if self._buyer_R is not None:
+			return (prices[:, None] <= self._buyer_R[None, :]) @ self._buyer_q_np
+		return self._tensor_demand(state_vector["price"], state_vector).numpy()
+
+	def _vectorized_supply(self, prices: np.ndarray, state_vector: Dict[str, Tensor]) -> np.ndarray:
+		self._ensure_cache()
+		if self._seller_R_sorted is not None:
+			count = np.searchsorted(self._seller_R_sorted, prices, side="right")
+			return count * self._seller_q_np[0]
+		if self._seller_R is not None:
+			return (prices[:, None] >= self._seller_R[None, :]) @ self._seller_q_np
+		return self._tensor_supply(state_vector["price"], state_vector).numpy()
+
+	def _tensor_demand(self, price_tensor: Tensor, state_vector: Dict[str, Tensor]) -> Tensor:
 		total = Tensor.zeros(price_tensor.shape, device=self.device)
 		for buyer in self.buyers:
 			contrib = buyer.demand_at_price(price_tensor, state_vector)
@@ -143,7 +461,7 @@ class Market:
 			total = total + contrib
 		return total
 
-	def _vectorized_supply(self, price_tensor: Tensor, state_vector: Dict[str, Tensor]) -> Tensor:
+	def _tensor_supply(self, price_tensor: Tensor, state_vector: Dict[str, Tensor]) -> Tensor:
 		total = Tensor.zeros(price_tensor.shape, device=self.device)
 		for seller in self.sellers:
 			contrib = seller.supply_at_price(price_tensor, state_vector)
@@ -151,35 +469,65 @@ class Market:
 			total = total + contrib
 		return total
 
+	def _tensor_participation(
+		self,
+		agents: Sequence[EconomicAgent],
+		flow: str,
+		price: Tensor | float,
+		market_state: Dict[str, Tensor],
+	) -> np.ndarray:
+		"""Mask of agents willing to trade, from their own ``demand_at_price``/``supply_at_price``.
+
+		Flows are concatenated and read back in one transfer; agents whose class
+		overrides ``willing_to_trade`` are asked directly.
+		"""
+
+		price_tensor = self._price_tensor(price)
+		flows = Tensor.cat(*[getattr(agent, flow)(price_tensor, market_state).reshape(-1) for agent in agents])
+		mask = flows.numpy() > 0
+		base = BuyerAgent if flow == "demand_at_price" else SellerAgent
+		for idx, agent in enumerate(agents):
+			if type(agent).willing_to_trade is not base.willing_to_trade:
+				mask[idx] = agent.willing_to_trade(price_tensor, market_state)
+		return mask
+
 	def execute_trades(
 		self,
 		step: int,
-		price: Tensor,
+		price: Tensor | float,
 		market_state: Dict[str, Tensor],
 		log_details: bool = False,
 	) -> TradeRecord:
+		self._ensure_cache()
+		price_val = np.float32(_price_value(price))
 		buyer_ids: List[str] = []
 		seller_ids: List[str] = []
 		buyer_quantity = 0.0
 		seller_quantity = 0.0
 
-		for buyer in self.buyers:
-			if buyer.willing_to_trade(price, market_state):
-				buyer_quantity += buyer.quantity
-				if log_details:
-					buyer_ids.append(buyer.agent_id)
-
-		for seller in self.sellers:
-			if seller.willing_to_trade(price, market_state):
-				seller_quantity += seller.quantity
-				if log_details:
-					seller_ids.append(seller.agent_id)
+		if self.buyers:
+			if self._buyer_R is None:
+				buyer_mask = self._tensor_participation(self.buyers, "demand_at_price", price, market_state)
+			else:
+				buyer_mask = (price_val <= self._buyer_R) & (self._buyer_q_np > 0)
+			buyer_quantity = float(self._buyer_q_np[buyer_mask].sum())
+			if log_details:
+				buyer_ids = [self._buyer_ids[i] for i in np.flatnonzero(buyer_mask)]
+
+		if self.sellers:
+			if self._seller_R is None:
+				seller_mask = self._tensor_participation(self.sellers, "supply_at_price", price, market_state)
+			else:
+				seller_mask = (price_val >= self._seller_R) & (self._seller_q_np > 0)
+			seller_quantity = float(self._seller_q_np[seller_mask].sum())
+			if log_details:
+				seller_ids = [self._seller_ids[i] for i in np.flatnonzero(seller_mask)]
 
 		settled_quantity = min(buyer_quantity, seller_quantity)
 
 		return TradeRecord(
 			step=step,
-			price=float(price.item()),
+			price=_price_value(price),
 			quantity=settled_quantity,
 			buyer_ids=buyer_ids,
 			seller_ids=seller_ids,
@@ -191,7 +539,7 @@ class Market:
 		supply = self.aggregate_supply(price, state)
 		return MarketObservation(
 			step=step,
-			price=float(price.item()),
+			price=_price_value(price),
 			demand=demand,
 			supply=supply,
 			excess=demand - supply,
@@ -212,16 +560,34 @@ class FixedSupplyMarket(Market):
 		super().__init__(buyers=buyers, sellers=sellers, device=device)
 		self.supply_capacity = supply_capacity
 
-	def aggregate_supply(self, price: Tensor, market_state: Dict[str, Tensor]) -> float:
+	@property
+	def supply_capacity(self) -> float:
+		return self._supply_capacity
+
+	@supply_capacity.setter
+	def supply_capacity(self, value: float) -> None:
+		self._supply_capacity = value
+		self._cache_valid = False
+
+	def aggregate_supply(self, price: Tensor | float, market_state: Dict[str, Tensor]) -> float:
 		return self.supply_capacity
 
-	def _vectorized_supply(self, price_tensor: Tensor, state_vector: Dict[str, Tensor]) -> Tensor:
-		return Tensor.full(price_tensor.shape, self.supply_capacity, device=self.device)
+	def _vectorized_supply(self, prices: np.ndarray, state_vector: Dict[str, Tensor]) -> np.ndarray:
+		return np.full(prices.shape, self.supply_capacity, dtype=np.float64)
+
+	def _reservation_schedules(self) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+		self._ensure_cache()
+		if not self._aggregates_from(FixedSupplyMarket) or self._buyer_R is None:
+			return None
+		# A single pseudo-seller that always supplies the full capacity.
+		seller_R = np.array([-np.inf], dtype=np.float32)
+		seller_q = np.array([self.supply_capacity], dtype=np.float64)
+		return self._buyer_R, self._buyer_q_np, seller_R, seller_q
 
 	def execute_trades(
 		self,
 		step: int,
-		price: Tensor,
+		price: Tensor | float,
 		market_state: Dict[str, Tensor],
 		log_details: bool = False,
 	) -> TradeRecord:
@@ -3,15 +3,134 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 from tinygrad import Tensor
 from tqdm.auto import tqdm
 
+from ._jit import njit
 from .config import SimulationConfig
 from .market import CurveData, Market, MarketObservation, TradeRecord
 
 
+_NOT_CONVERGED = 0
+_EXCESS_CONVERGED = 1
+_BRACKET_CONVERGED = 2
+_STEP_CONVERGED = 3
+
+# Refresh the per-step progress postfix only every this many tatonnement steps.
+_PROGRESS_EVERY = 16
+
+
+@njit(cache=True, nogil=True)
+def _scheduled_flows(
+    thresholds: np.ndarray,
+    signs: np.ndarray,
+    quantities: np.ndarray,
+    n_buyers: int,
+    price: float,
+) -> Tuple[float, float]:
+    hits = np.float32(price) * signs <= thresholds
+    demand = np.sum(quantities[:n_buyers] * hits[:n_buyers])
+    supply = np.sum(quantities[n_buyers:] * hits[n_buyers:])
+    return demand, supply
+
+
+@njit(cache=True, nogil=True)
+def _tatonnement_core(
+    thresholds: np.ndarray,
+    signs: np.ndarray,
+    quantities: np.ndarray,
+    n_buyers: int,
+    price_init: float,
+    lower: float,
+    upper: float,
+    price_floor: float,
+    price_ceiling: float,
+    tol: float,
+    price_tol: float,
+    adj_rate: float,
+    max_steps: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, int, int, bool, float, float, float]:
+    """Bracketed tatonnement over a fused reservation schedule.
+
+    Mirrors the tensor loop in :meth:`Simulation.run`. Returns the observed
+    ``(prices, demands, supplies)`` (first ``count`` entries), the number of
+    loop iterations, the convergence status, whether the loop ran without a
+    valid bracket, and the last excess, final bracket width and final price
+    for reporting.
+    """
+
+    prices = np.empty(max_steps + 1)
+    demands = np.empty(max_steps + 1)
+    supplies = np.empty(max_steps + 1)
+    count = 0
+    status = _NOT_CONVERGED
+    bracket_warning = False
+    last_excess = np.nan
+    bracket_width = np.nan
+    iterations = 0
+    price = price_init
+
+    lower_demand, lower_supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, lower)
+    upper_demand, upper_supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, upper)
+    lower_excess = lower_demand - lower_supply
+    upper_excess = upper_demand - upper_supply
+
+    for step in range(max_steps):
+        demand, supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, price)
+        excess = demand - supply
+        last_excess = excess
+        prices[count] = price
+        demands[count] = demand
+        supplies[count] = supply
+        count += 1
+        iterations += 1
+
+        if abs(excess) <= tol:
+            status = _EXCESS_CONVERGED
+            break
+
+        if excess > 0:
+            lower = max(lower, price)
+            lower_excess = excess
+        elif excess < 0:
+            upper = min(upper, price)
+            upper_excess = excess
+
+        bracket_ready = lower_excess > 0 and upper_excess < 0
+        if not bracket_ready:
+            bracket_warning = True
+
+        if bracket_ready and (upper - lower) <= price_tol:
+            status = _BRACKET_CONVERGED
+            bracket_width = upper - lower
+            final_price = max(price_floor, min(price_ceiling, (lower + upper) * 0.5))
+            if abs(final_price - price) > price_tol:
+                final_demand, final_supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, final_price)
+                prices[count] = final_price
+                demands[count] = final_demand
+                supplies[count] = final_supply
+                count += 1
+            price = final_price
+            break
+
+        if bracket_ready:
+            next_price = (lower + upper) * 0.5
+        else:
+            next_price = max(price_floor, min(price_ceiling, price + excess * adj_rate))
+
+        if abs(next_price - price) <= price_tol:
+            status = _STEP_CONVERGED
+            price = next_price
+            break
+
+        price = next_price
+
+    return prices, demands, supplies, count, iterations, status, bracket_warning, last_excess, bracket_width, price
+
+
 @dataclass(slots=True)
 class SimulationHistory:
     observations: List[MarketObservation] = field(default_factory=list)
@@ -33,6 +152,60 @@ class SimulationResult:
         return self.history.last_observation()
 
 
+def _bisect_equilibrium(
+    thresholds: np.ndarray,
+    signs: np.ndarray,
+    quantities: np.ndarray,
+    n_buyers: int,
+    lower: float,
+    upper: float,
+    tol: float,
+) -> Tuple[List[float], bool]:
+    """Locate the market-clearing price by bisection over reservation breakpoints.
+
+    Excess demand is a non-increasing step function that only changes at
+    reservation prices, so the equilibrium is either one of them or lies in the
+    open interval between two neighbours. Returns every probed price (the last
+    one being the estimate) and whether a clearing price or crossing was found.
+    """
+
+    def excess_at(price: float) -> float:
+        demand, supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, price)
+        return demand - supply
+
+    breakpoints = np.unique(thresholds * signs).astype(np.float64)
+    breakpoints = breakpoints[(breakpoints > lower) & (breakpoints < upper)]
+    candidates = np.concatenate(([lower], breakpoints, [upper]))
+
+    probes: List[float] = []
+    lo, hi = 0, len(candidates) - 1
+    first_non_positive = len(candidates)
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        price = float(candidates[mid])
+        excess = excess_at(price)
+        probes.append(price)
+        if abs(excess) <= tol:
+            return probes, True
+        if excess < 0:
+            first_non_positive = mid
+            hi = mid - 1
+        else:
+            lo = mid + 1
+
+    if first_non_positive == 0:
+        final_price, converged = lower, False
+    elif first_non_positive == len(candidates):
+        final_price, converged = upper, False
+    else:
+        # Excess is constant between neighbouring breakpoints; take the midpoint.
+        final_price = 0.5 * float(candidates[first_non_positive - 1] + candidates[first_non_positive])
+        converged = True
+    if not probes or probes[-1] != final_price:
+        probes.append(final_price)
+    return probes, converged
+
+
 class Simulation:
     """Runs tatonnement style price adjustment for a market."""
 
@@ -40,20 +213,45 @@ class Simulation:
         self.market = market
         self.config = config or SimulationConfig()
 
+    def reset(self, *, market: Optional[Market] = None, config: Optional[SimulationConfig] = None) -> None:
+        """Point the engine at a new market and/or configuration before the next :meth:`run`."""
+
+        if market is not None:
+            self.market = market
+        if config is not None:
+            self.config = config
+
     def _price_tensor(self, value: float) -> Tensor:
-        return Tensor([value], device=self.market.device)
+        # Written into the market's scratch buffer; callers consume it immediately.
+        return self.market._price_tensor(value)
 
     def _linspace(self, start: float, end: float, count: int) -> List[float]:
         if count <= 1:
             return [start]
-        step = (end - start) / (count - 1)
-        return [start + step * idx for idx in range(count)]
+        return np.linspace(start, end, count).tolist()
 
     def run(self) -> SimulationResult:
+        if self.market._host_path_available():
+            return self.run_numpy()
+        return self._run()
+
+    def run_numpy(self) -> SimulationResult:
+        """Run on the host without creating tinygrad tensors.
+
+        Requires a CPU market whose agents all use :class:`LinearPreferenceModel`
+        with host-side features; :meth:`run` selects this path automatically.
+        """
+
+        if not self.market._host_path_available():
+            raise ValueError(
+                "run_numpy requires a CPU market whose agents use LinearPreferenceModel with host features."
+            )
+        return self._run()
+
+    def _run(self) -> SimulationResult:
         history = SimulationHistory()
         config = self.config
         price_value = config.clamp_price(config.price_init)
-        price_tensor = self._price_tensor(price_value)
 
         curve_prices = self._linspace(
             config.curve_sampling.price_min,
@@ -68,6 +266,7 @@ class Simulation:
                 verify=config.curve_sampling.verify,
                 verify_samples=config.curve_sampling.verify_samples,
                 verify_tolerance=config.curve_sampling.verify_tolerance,
+                price_tolerance=config.curve_sampling.tolerance,
             )
             if config.record_state
             else None
@@ -79,6 +278,146 @@ class Simulation:
         if upper_price <= lower_price:
             raise ValueError("Simulation price bounds must satisfy lower < upper.")
 
+        fused = self.market._fused_schedule()
+        if fused is not None and config.exact_equilibrium:
+            converged, last_excess = self._solve_exact(history, fused, lower_price, upper_price)
+        elif fused is not None:
+            converged, last_excess = self._adjust_cached(history, fused, price_value, lower_price, upper_price)
+        else:
+            converged, last_excess = self._adjust_tensors(history, price_value, lower_price, upper_price)
+
+        if not converged and config.show_progress:
+            trailing_excess = last_excess if last_excess is not None else float("nan")
+            tqdm.write(
+                f"Reached max steps ({config.max_steps}) without convergence; "
+                f"last excess={trailing_excess:.3f}."
+            )
+
+        if config.log_trades and len(history.trades) < len(history.observations):
+            last_step = history.observations[-1].step
+            last_price = self._price_tensor(history.observations[-1].price)
+            state = self.market.build_state(last_step, last_price)
+            history.trades.append(
+                self.market.execute_trades(last_step, last_price, state, log_details=True)
+            )
+
+        return SimulationResult(market=self.market, config=config, history=history)
+
+    def _adjust_cached(
+        self,
+        history: SimulationHistory,
+        fused: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+        price_value: float,
+        lower_price: float,
+        upper_price: float,
+    ) -> Tuple[bool, Optional[float]]:
+        config = self.config
+        thresholds, signs, quantities, n_buyers = fused
+        price_floor, price_ceiling = config.price_bounds
+        (
+            prices,
+            demands,
+            supplies,
+            count,
+            iterations,
+            status,
+            bracket_warning,
+            last_excess,
+            bracket_width,
+            final_price,
+        ) = _tatonnement_core(
+            thresholds,
+            signs,
+            quantities,
+            n_buyers,
+            price_value,
+            lower_price,
+            upper_price,
+            price_floor,
+            price_ceiling,
+            config.tolerance,
+            config.price_tolerance,
+            config.adjustment_rate,
+            config.max_steps,
+        )
+
+        for step in range(count):
+            price = float(prices[step])
+            demand = float(demands[step])
+            supply = float(supplies[step])
+            history.observations.append(
+                MarketObservation(step=step, price=price, demand=demand, supply=supply, excess=demand - supply)
+            )
+            if config.log_trades:
+                history.trades.append(self.market.execute_trades(step, price, {}, log_details=True))
+
+        if config.show_progress:
+            step_progress = tqdm(total=config.max_steps, desc=config.progress_desc)
+            step_progress.update(iterations)
+            if iterations:
+                step_progress.set_postfix(
+                    price=f"{prices[iterations - 1]:.3f}",
+                    excess=f"{last_excess:.3f}",
+                )
+            step_progress.close()
+            if bracket_warning:
+                tqdm.write(
+                    "Tatonnement running without a valid price bracket; "
+                    "fallback adjustments may oscillate."
+                )
+            if status == _EXCESS_CONVERGED:
+                tqdm.write(
+                    f"Equilibrium reached at step {iterations - 1} "
+                    f"price {prices[iterations - 1]:.3f} excess {last_excess:.3f}"
+                )
+            elif status == _BRACKET_CONVERGED:
+                tqdm.write(
+                    f"Equilibrium bracketed within {bracket_width:.4f} price units; "
+                    f"estimated price {final_price:.3f}."
+                )
+
+        return status != _NOT_CONVERGED, (float(last_excess) if count else None)
+
+    def _solve_exact(
+        self,
+        history: SimulationHistory,
+        fused: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+        lower_price: float,
+        upper_price: float,
+    ) -> Tuple[bool, Optional[float]]:
+        config = self.config
+        thresholds, signs, quantities, n_buyers = fused
+        probes, converged = _bisect_equilibrium(
+            thresholds, signs, quantities, n_buyers, lower_price, upper_price, config.tolerance
+        )
+
+        excess = None
+        for step, price in enumerate(probes):
+            demand, supply = _scheduled_flows(thresholds, signs, quantities, n_buyers, price)
+            demand, supply = float(demand), float(supply)
+            excess = demand - supply
+            history.observations.append(
+                MarketObservation(step=step, price=price, demand=demand, supply=supply, excess=excess)
+            )
+            if config.log_trades:
+                history.trades.append(self.market.execute_trades(step, price, {}, log_details=True))
+
+        if converged and config.show_progress:
+            tqdm.write(
+                f"Equilibrium located by bisection after {len(probes)} probes; "
+                f"price {probes[-1]:.3f} excess {excess:.3f}"
+            )
+        return converged, excess
+
+    def _adjust_tensors(
+        self,
+        history: SimulationHistory,
+        price_value: float,
+        lower_price: float,
+        upper_price: float,
+    ) -> Tuple[bool, Optional[float]]:
+        config = self.config
+
         def evaluate_excess_at(price_val: float) -> float:
             probe_tensor = self._price_tensor(price_val)
             state = self.market.build_state(-1, probe_tensor)
@@ -88,6 +427,7 @@ class Simulation:
 
         lower_excess = evaluate_excess_at(lower_price)
         upper_excess = evaluate_excess_at(upper_price)
+        price_tensor = self._price_tensor(price_value)
         bracket_warning_issued = False
 
         converged = False
@@ -98,6 +438,7 @@ class Simulation:
                 range(config.max_steps),
                 desc=config.progress_desc,
                 total=config.max_steps,
+                mininterval=0.1,
             )
             step_iterable: Iterable[int] = step_progress
         else:
@@ -124,7 +465,9 @@ class Simulation:
                     trade = self.market.execute_trades(step, price_tensor, state, log_details=True)
                     history.trades.append(trade)
 
-                if step_progress is not None:
+                if step_progress is not None and (
+                    step % _PROGRESS_EVERY == 0 or abs(excess_value) <= config.tolerance * 2
+                ):
                     step_progress.set_postfix(
                         price=f"{price_value:.3f}",
                         excess=f"{excess_value:.3f}",
@@ -207,19 +550,4 @@ class Simulation:
             if step_progress is not None:
                 step_progress.close()
 
-        if not converged and config.show_progress:
-            trailing_excess = last_excess if last_excess is not None else float("nan")
-            tqdm.write(
-                f"Reached max steps ({config.max_steps}) without convergence; "
-                f"last excess={trailing_excess:.3f}."
-            )
-
-        if config.log_trades and len(history.trades) < len(history.observations):
-            last_step = history.observations[-1].step
-            last_price = self._price_tensor(history.observations[-1].price)
-            state = self.market.build_state(last_step, last_price)
-            history.trades.append(
-                self.market.execute_trades(last_step, last_price, state, log_details=True)
-            )
-
-        return SimulationResult(market=self.market, config=config, history=history)
+        return converged, last_excess
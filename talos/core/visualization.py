@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 import plotly.graph_objects as go
@@ -13,7 +13,7 @@ from .simulation import SimulationResult
 
 @dataclass(slots=True)
 class MarketVisualizer:
-	config: VisualizationConfig = VisualizationConfig()
+	config: VisualizationConfig = field(default_factory=VisualizationConfig)
 
 	def build_animation(self, result: SimulationResult) -> go.Figure:
 		history = result.history
@@ -57,12 +57,12 @@ class MarketVisualizer:
 		for obs in observations:
 			frames.append(
 				go.Frame(
+					# Only the current-point markers move; the curve traces stay static.
 					data=[
-						go.Scatter(x=curves.prices if curves else [], y=curves.demand if curves else []),
-						go.Scatter(x=curves.prices if curves else [], y=curves.supply if curves else []),
 						go.Scatter(x=[obs.price], y=[obs.demand]),
 						go.Scatter(x=[obs.price], y=[obs.supply]),
 					],
+					traces=[2, 3],
 					name=f"step-{obs.step}",
 					layout=go.Layout(title=f"Price {obs.price:.2f} | Step {obs.step}"),
 				)
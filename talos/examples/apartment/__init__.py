@@ -1,16 +1,27 @@
 """Apartment market example package."""
 
-from .agents import ApartmentHousehold, ApartmentLandlord
+from .agents import ApartmentHousehold, ApartmentLandlord, BuyersSoA, SellersSoA
 from .market import ApartmentMarket
 from .simulation import run_apartment_simulation, run_fixed_supply_apartment_simulation
-from .visualization import render_apartment_animation, render_fixed_supply_animation
+from .visualization import (
+	clear_simulation_cache,
+	render_all,
+	render_apartment_animation,
+	render_fixed_supply_animation,
+	render_scenarios,
+)
 
 __all__ = [
 	"ApartmentHousehold",
 	"ApartmentLandlord",
+	"BuyersSoA",
+	"SellersSoA",
 	"ApartmentMarket",
 	"run_apartment_simulation",
 	"run_fixed_supply_apartment_simulation",
 	"render_apartment_animation",
 	"render_fixed_supply_animation",
+	"render_all",
+	"clear_simulation_cache",
+	"render_scenarios",
 ]
@@ -2,25 +2,119 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from random import Random
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 from tinygrad import Tensor
 
-from ...core.agents import BuyerAgent, LinearPreferenceModel, SellerAgent
+from ...core._jit import NUMBA_AVAILABLE, njit, prange
+from ...core.agents import BuyerAgent, LinearPreferenceModel, SellerAgent, TensorLike
 
 
+# Models are pure functions of the features, so agents on a device share one instance.
+@lru_cache(maxsize=8)
 def _household_model(device: str) -> LinearPreferenceModel:
     weights = Tensor([2.1, 1.0, 0.8], device=device)
     bias = Tensor([-0.35], device=device)
     return LinearPreferenceModel(weights=weights, bias=bias)
 
 
+@lru_cache(maxsize=8)
 def _landlord_model(device: str) -> LinearPreferenceModel:
     weights = Tensor([0.9, 1.35, -0.9], device=device)
     bias = Tensor([0.55], device=device)
     return LinearPreferenceModel(weights=weights, bias=bias)
 
 
+# (low, high) bounds of the uniform draw for each sampled attribute, in feature order.
+_HOUSEHOLD_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "income": (22_000.0, 110_000.0),
+    "commute_penalty": (0.05, 0.85),
+    "size_need": (0.7, 1.5),
+}
+_LANDLORD_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "unit_quality": (0.45, 0.95),
+    "maintenance_cost": (0.22, 0.6),
+    "vacancy_risk": (0.04, 0.3),
+}
+
+
+def _sample_attrs(
+    rng: np.random.Generator, bounds: Dict[str, Tuple[float, float]], n: int
+) -> Dict[str, np.ndarray]:
+    # Single precision halves the bytes drawn and scanned; features are float32 anyway.
+    return {
+        name: np.float32(low) + np.float32(high - low) * rng.random(n, dtype=np.float32)
+        for name, (low, high) in bounds.items()
+    }
+
+
+# Populations larger than this are drawn in fixed-size chunks, each from its own jumped PCG64 stream.
+_SAMPLE_CHUNK = 16_384
+
+
+def _sample_chunked(
+    sampler: Callable[[np.random.Generator, int], Dict[str, np.ndarray]],
+    rng: np.random.Generator,
+    n: int,
+    parallel: bool,
+) -> Dict[str, np.ndarray]:
+    """Run ``sampler`` over ``n`` agents, splitting large populations into independent streams.
+
+    Chunk ``k`` draws from ``PCG64(seed).jumped(k)`` with ``seed`` taken from ``rng``,
+    so the result depends only on ``rng`` and ``n``, never on the number of threads.
+    """
+
+    if n <= _SAMPLE_CHUNK:
+        return sampler(rng, n)
+    base = np.random.PCG64(int(rng.integers(2**63 - 1)))
+    starts = range(0, n, _SAMPLE_CHUNK)
+
+    def draw(k: int) -> Dict[str, np.ndarray]:
+        return sampler(np.random.Generator(base.jumped(k)), min(_SAMPLE_CHUNK, n - starts[k]))
+
+    if parallel:
+        # NumPy releases the GIL while filling each chunk, so threads draw concurrently.
+        with ThreadPoolExecutor(max_workers=min(len(starts), os.cpu_count() or 1)) as executor:
+            chunks = list(executor.map(draw, range(len(starts))))
+    else:
+        chunks = [draw(k) for k in range(len(starts))]
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
+def _sample_household_attrs(rng: np.random.Generator, n: int) -> Dict[str, np.ndarray]:
+    """Draw every household attribute as a length-``n`` column, one call per attribute."""
+
+    return _sample_attrs(rng, _HOUSEHOLD_BOUNDS, n)
+
+
+def _sample_landlord_attrs(rng: np.random.Generator, n: int) -> Dict[str, np.ndarray]:
+    """Draw every landlord attribute as a length-``n`` column, one call per attribute."""
+
+    return _sample_attrs(rng, _LANDLORD_BOUNDS, n)
+
+
+# Compiled fill for the household feature matrix; without numba, from_arrays uses the NumPy equivalent.
+@njit(cache=True, parallel=True)
+def _household_features(
+    incomes: np.ndarray, commute_penalties: np.ndarray, size_needs: np.ndarray
+) -> np.ndarray:
+    """Fill the ``(n, 3)`` float32 household feature matrix in one compiled pass."""
+
+    n = incomes.shape[0]
+    out = np.empty((n, 3), dtype=np.float32)
+    for idx in prange(n):
+        out[idx, 0] = incomes[idx] / 100_000.0
+        out[idx, 1] = 1.0 - commute_penalties[idx]
+        out[idx, 2] = size_needs[idx]
+    return out
+
+
 class ApartmentHousehold(BuyerAgent):
     """Buyer configured for the apartment market."""
 
@@ -33,9 +127,13 @@ class ApartmentHousehold(BuyerAgent):
         commute_penalty: float = 0.4,
         size_need: float = 1.0,
         device: str = "cpu",
+        features: Optional[TensorLike] = None,
+        model: Optional[LinearPreferenceModel] = None,
     ) -> None:
-        features = [income / 100_000.0, 1.0 - commute_penalty, size_need]
-        model = _household_model(device)
+        if features is None:
+            features = [income / 100_000.0, 1.0 - commute_penalty, size_need]
+        if model is None:
+            model = _household_model(device)
         super().__init__(
             agent_id=agent_id,
             quantity=quantity,
@@ -47,6 +145,65 @@ class ApartmentHousehold(BuyerAgent):
         self.commute_penalty = commute_penalty
         self.size_need = size_need
 
+    @classmethod
+    def from_arrays(
+        cls,
+        ids: Sequence[str],
+        incomes: np.ndarray,
+        commute_penalties: np.ndarray,
+        size_needs: np.ndarray,
+        device: str = "cpu",
+    ) -> List["ApartmentHousehold"]:
+        """Wrap attribute columns as households sharing one feature matrix and one model.
+
+        Each household keeps its host row of the matrix; the device copy is
+        uploaded once and sliced per household only if a tensor path asks.
+        """
+
+        # Columns go in at their own (float32) precision; the kernel promotes the division itself.
+        columns = [np.asarray(col) for col in (incomes, commute_penalties, size_needs)]
+        if NUMBA_AVAILABLE:
+            np_features = _household_features(*columns)
+        else:
+            np_features = np.stack(
+                (columns[0] / 100_000.0, 1.0 - columns[1], columns[2]), axis=1
+            ).astype(np.float32, copy=False)
+        features = Tensor(np_features, device=device)
+        model = _household_model(device)
+        households = [
+            cls(
+                agent_id=agent_id,
+                income=float(income),
+                commute_penalty=float(commute_penalty),
+                size_need=float(size_need),
+                device=device,
+                features=row,
+                model=model,
+            )
+            for agent_id, income, commute_penalty, size_need, row in zip(
+                ids, incomes, commute_penalties, size_needs, np_features
+            )
+        ]
+        for idx, household in enumerate(households):
+            household._shared_features = (features, idx)
+        return households
+
+    @classmethod
+    def populate(
+        cls, rng: np.random.Generator, n: int, device: str = "cpu", *, parallel: bool = True
+    ) -> List["ApartmentHousehold"]:
+        """Sample ``n`` households with one batched draw per attribute.
+
+        The draw always runs on the host from ``rng``, so a seed yields the same
+        population on every device; the feature matrix then reaches ``device``
+        in a single upload. Large populations are drawn in chunks across threads
+        when ``parallel`` is set; the sample is the same either way.
+        """
+
+        ids = [f"hh-{idx}" for idx in range(n)]
+        attrs = _sample_chunked(_sample_household_attrs, rng, n, parallel)
+        return cls.from_arrays(ids, attrs["income"], attrs["commute_penalty"], attrs["size_need"], device)
+
 
 class ApartmentLandlord(SellerAgent):
     """Seller configured for the apartment market."""
@@ -60,9 +217,13 @@ class ApartmentLandlord(SellerAgent):
         maintenance_cost: float = 0.35,
         vacancy_risk: float = 0.15,
         device: str = "cpu",
+        features: Optional[TensorLike] = None,
+        model: Optional[LinearPreferenceModel] = None,
     ) -> None:
-        features = [unit_quality, maintenance_cost, vacancy_risk]
-        model = _landlord_model(device)
+        if features is None:
+            features = [unit_quality, maintenance_cost, vacancy_risk]
+        if model is None:
+            model = _landlord_model(device)
         super().__init__(
             agent_id=agent_id,
             quantity=quantity,
@@ -74,6 +235,172 @@ class ApartmentLandlord(SellerAgent):
         self.maintenance_cost = maintenance_cost
         self.vacancy_risk = vacancy_risk
 
+    @classmethod
+    def from_arrays(
+        cls,
+        ids: Sequence[str],
+        unit_qualities: np.ndarray,
+        maintenance_costs: np.ndarray,
+        vacancy_risks: np.ndarray,
+        device: str = "cpu",
+    ) -> List["ApartmentLandlord"]:
+        """Wrap attribute columns as landlords sharing one feature matrix and one model."""
+
+        np_features = np.stack((unit_qualities, maintenance_costs, vacancy_risks), axis=1).astype(
+            np.float32, copy=False
+        )
+        features = Tensor(np_features, device=device)
+        model = _landlord_model(device)
+        landlords = [
+            cls(
+                agent_id=agent_id,
+                unit_quality=float(unit_quality),
+                maintenance_cost=float(maintenance_cost),
+                vacancy_risk=float(vacancy_risk),
+                device=device,
+                features=row,
+                model=model,
+            )
+            for agent_id, unit_quality, maintenance_cost, vacancy_risk, row in zip(
+                ids, unit_qualities, maintenance_costs, vacancy_risks, np_features
+            )
+        ]
+        for idx, landlord in enumerate(landlords):
+            landlord._shared_features = (features, idx)
+        return landlords
+
+    @classmethod
+    def populate(
+        cls, rng: np.random.Generator, n: int, device: str = "cpu", *, parallel: bool = True
+    ) -> List["ApartmentLandlord"]:
+        """Sample ``n`` landlords with one batched draw per attribute.
+
+        Drawn on the host like :meth:`ApartmentHousehold.populate`.
+        """
+
+        ids = [f"ll-{idx}" for idx in range(n)]
+        attrs = _sample_chunked(_sample_landlord_attrs, rng, n, parallel)
+        return cls.from_arrays(
+            ids, attrs["unit_quality"], attrs["maintenance_cost"], attrs["vacancy_risk"], device
+        )
+
+
+class _AgentView:
+    """Zero-copy view of one row of an agent column store."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: "_AgentColumns", index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    @property
+    def agent_id(self) -> str:
+        return str(self._columns.ids[self._index])
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._columns, name)[self._index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.agent_id!r})"
+
+
+class HouseholdView(_AgentView):
+    """Row view over :class:`BuyersSoA`."""
+
+    __slots__ = ()
+
+
+class LandlordView(_AgentView):
+    """Row view over :class:`SellersSoA`."""
+
+    __slots__ = ()
+
+
+class _AgentColumns:
+    """Shared behaviour of the columnar agent stores; ``ids`` plus one array per attribute.
+
+    Attribute columns are float32. That keeps about seven significant digits,
+    so incomes resolve to roughly a cent and the unit-scale attributes to
+    ~1e-7. That is well below what the float32 reservation features can
+    distinguish. Prices on a fixed grid use ``PRICE_DTYPE``/``PRICE_SCALE``
+    from :mod:`talos.core.market`.
+    """
+
+    _agent_cls: ClassVar[type]
+    _view_cls: ClassVar[type]
+    _id_prefix: ClassVar[str]
+    _sampler: ClassVar[Callable[[np.random.Generator, int], Dict[str, np.ndarray]]]
+
+    ids: np.ndarray
+
+    @classmethod
+    def attribute_names(cls) -> List[str]:
+        return [f.name for f in fields(cls) if f.name != "ids"]
+
+    @classmethod
+    def from_agents(cls, agents: Iterable[Any]) -> "_AgentColumns":
+        """Collect the attribute columns of ``agents``, skipping agents of any other type."""
+
+        agents = [agent for agent in agents if isinstance(agent, cls._agent_cls)]
+        columns = {
+            name: np.fromiter((getattr(agent, name) for agent in agents), dtype=np.float32, count=len(agents))
+            for name in cls.attribute_names()
+        }
+        return cls(ids=np.array([agent.agent_id for agent in agents], dtype=object), **columns)
+
+    @classmethod
+    def sample(cls, rng: np.random.Generator, n: int, *, parallel: bool = True) -> "_AgentColumns":
+        """Draw ``n`` rows; the same sample as the agents' ``populate`` on the CPU."""
+
+        columns = _sample_chunked(cls._sampler, rng, n, parallel)
+        ids = np.array([f"{cls._id_prefix}-{idx}" for idx in range(n)], dtype=object)
+        return cls(ids=ids, **columns)
+
+    def to_agents(self, device: str = "cpu") -> list:
+        columns = [getattr(self, name) for name in self.attribute_names()]
+        return self._agent_cls.from_arrays(list(self.ids), *columns, device)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> _AgentView:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return self._view_cls(self, index % len(self))
+
+
+@dataclass
+class BuyersSoA(_AgentColumns):
+    """Household attributes stored column-wise, one array per attribute."""
+
+    _agent_cls: ClassVar[type] = ApartmentHousehold
+    _view_cls: ClassVar[type] = HouseholdView
+    _id_prefix: ClassVar[str] = "hh"
+    _sampler: ClassVar = staticmethod(_sample_household_attrs)
+
+    ids: np.ndarray
+    income: np.ndarray  # float32
+    commute_penalty: np.ndarray  # float32
+    size_need: np.ndarray  # float32
+
+
+@dataclass
+class SellersSoA(_AgentColumns):
+    """Landlord attributes stored column-wise, one array per attribute."""
+
+    _agent_cls: ClassVar[type] = ApartmentLandlord
+    _view_cls: ClassVar[type] = LandlordView
+    _id_prefix: ClassVar[str] = "ll"
+    _sampler: ClassVar = staticmethod(_sample_landlord_attrs)
+
+    ids: np.ndarray
+    unit_quality: np.ndarray  # float32
+    maintenance_cost: np.ndarray  # float32
+    vacancy_risk: np.ndarray  # float32
+
 
 def random_household(rng: Random, idx: int, device: str) -> ApartmentHousehold:
     return ApartmentHousehold(
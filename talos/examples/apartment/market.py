@@ -2,25 +2,77 @@
 
 from __future__ import annotations
 
-from random import Random
 from typing import Iterable, Optional
 
+import numpy as np
+
+from ...core.agents import BuyerAgent, SellerAgent
 from ...core.market import FixedSupplyMarket, Market
-from .agents import ApartmentHousehold, ApartmentLandlord, random_household, random_landlord
+from .agents import ApartmentHousehold, ApartmentLandlord, BuyersSoA, SellersSoA
+
+
+# Supply is exogenous in the fixed-supply market; Market copies this into its own list.
+_NO_SELLERS: tuple[ApartmentLandlord, ...] = ()
 
 
 class ApartmentMarket(Market):
-    """Market populated with apartment seekers and landlords."""
+    """Market populated with apartment seekers and landlords.
+
+    The agent lists are the backing storage. ``buyers``/``sellers`` may also be
+    given as column stores, which are expanded into agents. ``buyers_soa`` and
+    ``sellers_soa`` are snapshots built from the agents on demand. They are
+    rebuilt after ``register_buyer``/``register_seller``, but not after
+    in-place edits of agent attributes or direct appends to the agent lists,
+    and they keep the original attributes when ``update_context`` replaces an
+    agent's features.
+    """
 
     def __init__(
         self,
-        buyers: Optional[Iterable[ApartmentHousehold]] = None,
-        sellers: Optional[Iterable[ApartmentLandlord]] = None,
+        buyers: Optional[Iterable[ApartmentHousehold] | BuyersSoA] = None,
+        sellers: Optional[Iterable[ApartmentLandlord] | SellersSoA] = None,
         *,
         device: str = "cpu",
     ) -> None:
+        # Export views only; left unbuilt until read so attributes are not held twice.
+        self._buyers_soa: Optional[BuyersSoA] = None
+        self._sellers_soa: Optional[SellersSoA] = None
+        if isinstance(buyers, BuyersSoA):
+            buyers = buyers.to_agents(device)
+        if isinstance(sellers, SellersSoA):
+            sellers = sellers.to_agents(device)
         super().__init__(buyers=buyers, sellers=sellers, device=device)
 
+    @property
+    def buyers_soa(self) -> BuyersSoA:
+        """Snapshot of household attributes as columns, rebuilt on first read after a registration.
+
+        Buyers that are not :class:`ApartmentHousehold` have no such attributes and are left out.
+        """
+
+        if self._buyers_soa is None:
+            self._buyers_soa = BuyersSoA.from_agents(self.buyers)
+        return self._buyers_soa
+
+    @property
+    def sellers_soa(self) -> SellersSoA:
+        """Snapshot of landlord attributes as columns, rebuilt on first read after a registration.
+
+        Sellers that are not :class:`ApartmentLandlord` have no such attributes and are left out.
+        """
+
+        if self._sellers_soa is None:
+            self._sellers_soa = SellersSoA.from_agents(self.sellers)
+        return self._sellers_soa
+
+    def register_buyer(self, agent: BuyerAgent) -> None:
+        super().register_buyer(agent)
+        self._buyers_soa = None
+
+    def register_seller(self, agent: SellerAgent) -> None:
+        super().register_seller(agent)
+        self._sellers_soa = None
+
     @classmethod
     def from_random(
         cls,
@@ -29,10 +81,11 @@ class ApartmentMarket(Market):
         *,
         seed: Optional[int] = None,
         device: str = "cpu",
+        parallel: bool = True,
     ) -> "ApartmentMarket":
-        rng = Random(seed)
-        buyers = [random_household(rng, idx, device) for idx in range(buyer_count)]
-        sellers = [random_landlord(rng, idx, device) for idx in range(seller_count)]
+        rng = np.random.default_rng(seed)
+        buyers = ApartmentHousehold.populate(rng, buyer_count, device, parallel=parallel)
+        sellers = ApartmentLandlord.populate(rng, seller_count, device, parallel=parallel)
         return cls(buyers=buyers, sellers=sellers, device=device)
 
 
@@ -46,11 +99,10 @@ class FixedSupplyApartmentMarket(FixedSupplyMarket):
         buyers: Optional[Iterable[ApartmentHousehold]] = None,
         device: str = "cpu",
     ) -> None:
-        sellers: list[ApartmentLandlord] = []
         super().__init__(
             supply_capacity=supply_capacity,
-            buyers=list(buyers) if buyers is not None else None,
-            sellers=sellers,
+            buyers=buyers,
+            sellers=_NO_SELLERS,
             device=device,
         )
 
@@ -62,7 +114,8 @@ class FixedSupplyApartmentMarket(FixedSupplyMarket):
         *,
         seed: Optional[int] = None,
         device: str = "cpu",
+        parallel: bool = True,
     ) -> "FixedSupplyApartmentMarket":
-        rng = Random(seed)
-        buyers = [random_household(rng, idx, device) for idx in range(buyer_count)]
+        rng = np.random.default_rng(seed)
+        buyers = ApartmentHousehold.populate(rng, buyer_count, device, parallel=parallel)
         return cls(supply_capacity=supply_capacity, buyers=buyers, device=device)
@@ -9,13 +9,13 @@ from .config import apartment_simulation_config
 from .market import ApartmentMarket, FixedSupplyApartmentMarket
 
 
-def run_apartment_simulation(
+def build_apartment_simulation(
 	*,
 	buyer_count: int = 64,
 	seller_count: int = 48,
 	seed: Optional[int] = 1234,
 	log_trades: bool = True,
-) -> SimulationResult:
+) -> Simulation:
 	market = ApartmentMarket.from_random(
 		buyer_count=buyer_count,
 		seller_count=seller_count,
@@ -25,17 +25,16 @@ def run_apartment_simulation(
 		log_trades=log_trades,
 		random_seed=seed,
 	)
-	simulation = Simulation(market=market, config=config)
-	return simulation.run()
+	return Simulation(market=market, config=config)
 
 
-def run_fixed_supply_apartment_simulation(
+def build_fixed_supply_apartment_simulation(
 	*,
 	buyer_count: int = 72,
 	supply_capacity: float = 48.0,
 	seed: Optional[int] = 1234,
 	log_trades: bool = True,
-) -> SimulationResult:
+) -> Simulation:
 	market = FixedSupplyApartmentMarket.from_random(
 		supply_capacity=supply_capacity,
 		buyer_count=buyer_count,
@@ -45,5 +44,34 @@ def run_fixed_supply_apartment_simulation(
 		log_trades=log_trades,
 		random_seed=seed,
 	)
-	simulation = Simulation(market=market, config=config)
-	return simulation.run()
+	return Simulation(market=market, config=config)
+
+
+def run_apartment_simulation(
+	*,
+	buyer_count: int = 64,
+	seller_count: int = 48,
+	seed: Optional[int] = 1234,
+	log_trades: bool = True,
+) -> SimulationResult:
+	return build_apartment_simulation(
+		buyer_count=buyer_count,
+		seller_count=seller_count,
+		seed=seed,
+		log_trades=log_trades,
+	).run()
+
+
+def run_fixed_supply_apartment_simulation(
+	*,
+	buyer_count: int = 72,
+	supply_capacity: float = 48.0,
+	seed: Optional[int] = 1234,
+	log_trades: bool = True,
+) -> SimulationResult:
+	return build_fixed_supply_apartment_simulation(
+		buyer_count=buyer_count,
+		supply_capacity=supply_capacity,
+		seed=seed,
+		log_trades=log_trades,
+	).run()
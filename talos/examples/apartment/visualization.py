@@ -2,13 +2,83 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from ...core.config import VisualizationConfig
+from ...core.config import SimulationConfig, VisualizationConfig
+from ...core.market import Market
+from ...core.simulation import Simulation, SimulationResult
 from ...core.visualization import MarketVisualizer
-from .simulation import run_apartment_simulation, run_fixed_supply_apartment_simulation
+from .market import ApartmentMarket, FixedSupplyApartmentMarket
+from .config import apartment_simulation_config
+from .simulation import (
+	build_apartment_simulation,
+	build_fixed_supply_apartment_simulation,
+	run_apartment_simulation,
+	run_fixed_supply_apartment_simulation,
+)
+
+
+# Seeded runs are deterministic, so repeated renders of one scenario reuse its result.
+@lru_cache(maxsize=16)
+def _cached_apartment_result(
+	buyer_count: int, seller_count: int, seed: int, log_trades: bool
+) -> SimulationResult:
+	return run_apartment_simulation(
+		buyer_count=buyer_count,
+		seller_count=seller_count,
+		seed=seed,
+		log_trades=log_trades,
+	)
+
+
+@lru_cache(maxsize=16)
+def _cached_fixed_supply_result(
+	buyer_count: int, supply_capacity: float, seed: int, log_trades: bool
+) -> SimulationResult:
+	return run_fixed_supply_apartment_simulation(
+		buyer_count=buyer_count,
+		supply_capacity=supply_capacity,
+		seed=seed,
+		log_trades=log_trades,
+	)
+
+
+def clear_simulation_cache() -> None:
+	"""Forget simulation results memoized by the render helpers."""
+
+	_cached_apartment_result.cache_clear()
+	_cached_fixed_supply_result.cache_clear()
+
+
+_RENDER_COUNTER = itertools.count()
+
+
+def _resolve_output_path(
+	output_path: Optional[str | Path],
+	output_dir: str | Path,
+	filename_prefix: str,
+	timestamp: Optional[str],
+) -> Path:
+	if output_path is None:
+		# Generated stamps carry a process-wide counter so renders within one second never collide.
+		stamp = timestamp or f"{time.strftime('%Y%m%d-%H%M%S')}-{next(_RENDER_COUNTER):04d}"
+		target_dir = Path(output_dir)
+		target_dir.mkdir(parents=True, exist_ok=True)
+		return target_dir / f"{filename_prefix}_{stamp}.html"
+	final_path = Path(output_path)
+	final_path.parent.mkdir(parents=True, exist_ok=True)
+	return final_path
+
+
+def _write_animation(result: SimulationResult, final_path: Path) -> None:
+	viz_config = VisualizationConfig(output_path=str(final_path), show_trade_log=True)
+	visualizer = MarketVisualizer(config=viz_config)
+	visualizer.build_animation(result)
 
 
 def render_apartment_animation(
@@ -21,26 +91,18 @@ def render_apartment_animation(
 	filename_prefix: str = "apartment_market_animation",
 	timestamp: Optional[str] = None,
 ) -> Path:
-	"""Run the apartment simulation and persist the Plotly animation."""
+	"""Run the apartment simulation and persist the Plotly animation.
 
-	result = run_apartment_simulation(
-		buyer_count=buyer_count,
-		seller_count=seller_count,
-		seed=seed,
-	)
+	Results for a given seed are memoized; see :func:`clear_simulation_cache`.
+	"""
 
-	if output_path is None:
-		stamp = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
-		target_dir = Path(output_dir)
-		target_dir.mkdir(parents=True, exist_ok=True)
-		final_path = target_dir / f"{filename_prefix}_{stamp}.html"
+	if seed is None:
+		result = run_apartment_simulation(buyer_count=buyer_count, seller_count=seller_count, seed=seed)
 	else:
-		final_path = Path(output_path)
-		final_path.parent.mkdir(parents=True, exist_ok=True)
+		result = _cached_apartment_result(buyer_count, seller_count, seed, True)
 
-	viz_config = VisualizationConfig(output_path=str(final_path), show_trade_log=True)
-	visualizer = MarketVisualizer(config=viz_config)
-	visualizer.build_animation(result)
+	final_path = _resolve_output_path(output_path, output_dir, filename_prefix, timestamp)
+	_write_animation(result, final_path)
 	return final_path
 
 
@@ -56,22 +118,125 @@ def render_fixed_supply_animation(
 ) -> Path:
 	"""Render an animation for the fixed-supply apartment scenario."""
 
-	result = run_fixed_supply_apartment_simulation(
-		buyer_count=buyer_count,
-		supply_capacity=supply_capacity,
+	if seed is None:
+		result = run_fixed_supply_apartment_simulation(
+			buyer_count=buyer_count,
+			supply_capacity=supply_capacity,
+			seed=seed,
+		)
+	else:
+		result = _cached_fixed_supply_result(buyer_count, supply_capacity, seed, True)
+
+	final_path = _resolve_output_path(output_path, output_dir, filename_prefix, timestamp)
+	_write_animation(result, final_path)
+	return final_path
+
+
+def render_all(
+	*,
+	buyer_count: int = 64,
+	seller_count: int = 48,
+	fixed_buyer_count: int = 72,
+	supply_capacity: float = 48.0,
+	seed: Optional[int] = 1234,
+	output_dir: str | Path = Path("artifacts"),
+	timestamp: Optional[str] = None,
+) -> Tuple[Path, Path]:
+	"""Render both apartment scenarios, running their simulations concurrently.
+
+	Markets are built on the calling thread. When both can run on the NumPy
+	host path, the simulations then run on worker threads without progress
+	output; the compiled tatonnement core releases the GIL, so they overlap.
+	Plotly is not thread-safe, so the animations are written one after the
+	other.
+	"""
+
+	simulations = [
+		build_apartment_simulation(buyer_count=buyer_count, seller_count=seller_count, seed=seed),
+		build_fixed_supply_apartment_simulation(
+			buyer_count=fixed_buyer_count,
+			supply_capacity=supply_capacity,
+			seed=seed,
+		),
+	]
+	# tinygrad is not thread-safe: caches are warmed here, and only NumPy-only runs go to threads.
+	if all(simulation.market._host_path_available() for simulation in simulations):
+		# Concurrent progress bars would interleave on the terminal, so threaded runs stay quiet.
+		for simulation in simulations:
+			simulation.config.show_progress = False
+		with ThreadPoolExecutor(max_workers=len(simulations)) as executor:
+			apartment_result, fixed_result = executor.map(Simulation.run, simulations)
+	else:
+		apartment_result, fixed_result = (simulation.run() for simulation in simulations)
+
+	apartment_path = _resolve_output_path(None, output_dir, "apartment_market_animation", timestamp)
+	_write_animation(apartment_result, apartment_path)
+	fixed_path = _resolve_output_path(None, output_dir, "apartment_fixed_supply_animation", timestamp)
+	_write_animation(fixed_result, fixed_path)
+	return apartment_path, fixed_path
+
+
+_APARTMENT_KEYS = frozenset({"buyer_count", "seller_count", "seed", "log_trades", "output_path"})
+_FIXED_SUPPLY_KEYS = frozenset({"buyer_count", "supply_capacity", "seed", "log_trades", "output_path"})
+
+
+def _scenario_setup(scenario: Dict[str, Any]) -> Tuple[Market, SimulationConfig, str]:
+	fixed_supply = "supply_capacity" in scenario
+	unknown = set(scenario) - (_FIXED_SUPPLY_KEYS if fixed_supply else _APARTMENT_KEYS)
+	if unknown:
+		raise ValueError(f"Unknown scenario parameters: {sorted(unknown)}")
+
+	seed = scenario.get("seed", 1234)
+	config = apartment_simulation_config(log_trades=scenario.get("log_trades", True), random_seed=seed)
+	if fixed_supply:
+		market: Market = FixedSupplyApartmentMarket.from_random(
+			supply_capacity=scenario["supply_capacity"],
+			buyer_count=scenario.get("buyer_count", 72),
+			seed=seed,
+		)
+		return market, config, "apartment_fixed_supply_animation"
+	market = ApartmentMarket.from_random(
+		buyer_count=scenario.get("buyer_count", 64),
+		seller_count=scenario.get("seller_count", 48),
 		seed=seed,
 	)
+	return market, config, "apartment_market_animation"
 
-	if output_path is None:
-		stamp = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
-		target_dir = Path(output_dir)
-		target_dir.mkdir(parents=True, exist_ok=True)
-		final_path = target_dir / f"{filename_prefix}_{stamp}.html"
-	else:
-		final_path = Path(output_path)
-		final_path.parent.mkdir(parents=True, exist_ok=True)
 
-	viz_config = VisualizationConfig(output_path=str(final_path), show_trade_log=True)
-	visualizer = MarketVisualizer(config=viz_config)
-	visualizer.build_animation(result)
-	return final_path
+def render_scenarios(
+	params: Iterable[Dict[str, Any]],
+	*,
+	output_dir: str | Path = Path("artifacts"),
+	timestamp: Optional[str] = None,
+) -> List[Path]:
+	"""Render a parameter sweep of apartment scenarios with one shared Simulation engine.
+
+	Each entry takes the keyword arguments of :func:`render_apartment_animation`
+	(``buyer_count``, ``seller_count``, ``seed``, ``output_path``), or of
+	:func:`render_fixed_supply_animation` when it has ``supply_capacity``, plus
+	``log_trades``. Simulations run on the calling thread. A single background
+	writer saves each animation while the next scenario simulates. Paths are
+	returned in input order; a given ``timestamp`` is suffixed with the
+	scenario index.
+	"""
+
+	engine: Optional[Simulation] = None
+	paths: List[Path] = []
+	# One writer keeps Plotly and the shared visualizer single-threaded.
+	with ThreadPoolExecutor(max_workers=1) as writer:
+		pending = []
+		for index, scenario in enumerate(params):
+			market, config, prefix = _scenario_setup(scenario)
+			if engine is None:
+				engine = Simulation(market=market, config=config)
+			else:
+				engine.reset(market=market, config=config)
+			result = engine.run()
+			# A shared timestamp gets the scenario index so same-kind scenarios never collide.
+			stamp = f"{timestamp}-{index:04d}" if timestamp is not None else None
+			final_path = _resolve_output_path(scenario.get("output_path"), output_dir, prefix, stamp)
+			pending.append(writer.submit(_write_animation, result, final_path))
+			paths.append(final_path)
+		for future in pending:
+			future.result()
+	return paths